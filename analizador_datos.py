@@ -5,8 +5,13 @@ Lectura eficiente por chunks para no saturar RAM
 Detección inteligente de encabezados
 """
 
+import functools
+import itertools
+import multiprocessing
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Dict, List, Optional, Callable, Tuple
 from fpdf import FPDF
 
@@ -14,6 +19,72 @@ from fpdf import FPDF
 CHUNK_SIZE = 10000  # filas por chunk
 MUESTRA_VALORES = 5  # valores únicos de muestra por columna
 MAX_FILAS_BUSQUEDA_HEADER = 20  # Máximo de filas a analizar para encontrar encabezados
+MAX_FILAS_DETECCION_TIPO = 1000  # Filas iniciales donde se busca el tipo de las columnas de texto
+
+# Escaneo de directorios
+_CARPETAS_EXCLUIDAS = ('.git', '__pycache__', 'node_modules', 'venv', '.venv')
+_EXTENSIONES_DATOS = ('.csv', '.xlsx', '.xls', '.parquet', '.pq')
+
+# Procesos para el análisis; en Windows ProcessPoolExecutor no admite más de 61
+_MAX_PROCESOS = min(os.cpu_count() or 1, 61) if sys.platform == 'win32' else (os.cpu_count() or 1)
+
+# Palabras clave comunes en encabezados
+_PALABRAS_HEADER = frozenset({
+    'id', 'nombre', 'name', 'fecha', 'date', 'codigo', 'code', 'tipo', 'type',
+    'descripcion', 'description', 'cantidad', 'amount', 'total', 'precio', 'price',
+    'estado', 'status', 'usuario', 'user', 'email', 'telefono', 'phone',
+    'direccion', 'address', 'ciudad', 'city', 'pais', 'country', 'numero', 'number',
+    'clave', 'key', 'valor', 'value', 'categoria', 'category', 'producto', 'product',
+    'cliente', 'customer', 'orden', 'order', 'factura', 'invoice', 'cuenta', 'account',
+    'año', 'year', 'mes', 'month', 'dia', 'day', 'hora', 'time', 'created', 'updated'
+})
+
+# Expresiones precompiladas para la evaluación de encabezados
+_IDENT_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+_NUM_RE = re.compile(r'^-?\d+([.,]\d+)?$')
+
+
+def _compilar_buscador_palabras(palabras) -> Callable[[str], bool]:
+    """
+    Compila las palabras clave en un solo buscador de subcadenas que recorre
+    cada celda una vez: autómata Aho-Corasick si pyahocorasick está instalado,
+    si no, una alternancia regex precompilada (mismo resultado).
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        patron = re.compile('|'.join(re.escape(p) for p in palabras))
+        return lambda texto: patron.search(texto) is not None
+    
+    automata = ahocorasick.Automaton()
+    for palabra in palabras:
+        automata.add_word(palabra, palabra)
+    automata.make_automaton()
+    return lambda texto: next(automata.iter(texto), None) is not None
+
+
+_contiene_palabra_header = _compilar_buscador_palabras(_PALABRAS_HEADER)
+
+# Detección de delimitador CSV
+_DELIMITADORES = (b',', b';', b'\t', b'|')
+_BYTES_MUESTRA_DELIMITADOR = 64 * 1024
+
+# Unidades para _formato_bytes
+_UNIDADES_BYTES = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def _latin1(texto: str) -> str:
+    """Reemplaza caracteres fuera de latin-1. Los textos ASCII (la mayoría)
+    se devuelven tal cual, sin codificar ni consultar la caché."""
+    if texto.isascii():
+        return texto
+    return _latin1_recodificar(texto)
+
+
+@functools.lru_cache(maxsize=4096)
+def _latin1_recodificar(texto: str) -> str:
+    """Round-trip latin-1 memoizado (los nombres de columna se repiten mucho)"""
+    return texto.encode('latin-1', 'replace').decode('latin-1')
 
 
 class PDFDatos(FPDF):
@@ -33,11 +104,11 @@ class PDFDatos(FPDF):
     def archivo_header(self, nombre, tipo, ruta):
         self.set_fill_color(200, 220, 255)
         self.set_font('Arial', 'B', 10)
-        nombre_clean = nombre.encode('latin-1', 'replace').decode('latin-1')
+        nombre_clean = _latin1(nombre)
         self.cell(0, 7, f'ARCHIVO: {nombre_clean}', 0, 1, 'L', 1)
         self.set_font('Arial', '', 8)
         self.cell(0, 5, f'Tipo: {tipo}', 0, 1)
-        ruta_clean = ruta.encode('latin-1', 'replace').decode('latin-1')[:100]
+        ruta_clean = _latin1(ruta)[:100]
         self.cell(0, 5, f'Ruta: {ruta_clean}', 0, 1)
     
     def error(self, mensaje):
@@ -48,19 +119,19 @@ class PDFDatos(FPDF):
     
     def info(self, texto):
         self.set_font('Arial', '', 8)
-        texto_clean = texto.encode('latin-1', 'replace').decode('latin-1')
+        texto_clean = _latin1(texto)
         self.cell(0, 5, texto_clean[:120], 0, 1)
     
     def hoja_header(self, nombre):
         self.set_font('Arial', 'B', 9)
         self.set_fill_color(230, 230, 230)
-        nombre_clean = nombre.encode('latin-1', 'replace').decode('latin-1')
+        nombre_clean = _latin1(nombre)
         self.cell(0, 6, f'  HOJA: {nombre_clean}', 0, 1, 'L', 1)
     
     def columna(self, nombre, tipo, muestra):
         self.set_font('Courier', '', 7)
-        nombre_clean = nombre.encode('latin-1', 'replace').decode('latin-1')[:30]
-        muestra_clean = muestra.encode('latin-1', 'replace').decode('latin-1')[:50]
+        nombre_clean = _latin1(nombre)[:30]
+        muestra_clean = _latin1(muestra)[:50]
         self.cell(0, 4, f'    - {nombre_clean} [{tipo}]: {muestra_clean}', 0, 1)
 
 
@@ -82,17 +153,6 @@ def _es_encabezado_valido(fila: List, min_columnas: int = 2) -> Tuple[bool, floa
     num_celdas = len(fila)
     celdas_validas = 0
     
-    # Palabras clave comunes en encabezados
-    palabras_header = {
-        'id', 'nombre', 'name', 'fecha', 'date', 'codigo', 'code', 'tipo', 'type',
-        'descripcion', 'description', 'cantidad', 'amount', 'total', 'precio', 'price',
-        'estado', 'status', 'usuario', 'user', 'email', 'telefono', 'phone',
-        'direccion', 'address', 'ciudad', 'city', 'pais', 'country', 'numero', 'number',
-        'clave', 'key', 'valor', 'value', 'categoria', 'category', 'producto', 'product',
-        'cliente', 'customer', 'orden', 'order', 'factura', 'invoice', 'cuenta', 'account',
-        'año', 'year', 'mes', 'month', 'dia', 'day', 'hora', 'time', 'created', 'updated'
-    }
-    
     for celda in fila:
         if celda is None or str(celda).strip() == '':
             continue
@@ -101,21 +161,16 @@ def _es_encabezado_valido(fila: List, min_columnas: int = 2) -> Tuple[bool, floa
         celdas_validas += 1
         
         # Penalizar si es un número puro
-        try:
-            float(celda_str.replace(',', '.'))
+        if _NUM_RE.match(celda_str):
             score -= 0.3
             continue
-        except:
-            pass
         
         # Bonus si contiene palabras clave de encabezado
-        for palabra in palabras_header:
-            if palabra in celda_str:
-                score += 0.5
-                break
+        if _contiene_palabra_header(celda_str):
+            score += 0.5
         
         # Bonus si tiene formato de identificador (snake_case, camelCase, etc.)
-        if re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', celda_str):
+        if _IDENT_RE.match(celda_str):
             score += 0.3
         
         # Bonus si tiene longitud razonable para un título
@@ -174,8 +229,9 @@ def _buscar_fila_encabezado(filas: List[List], callback: Optional[Callable] = No
     return mejor_idx, headers
 
 
-def analizar_csv(ruta: str, callback: Optional[Callable] = None) -> Dict:
-    """Analiza archivo CSV por chunks con detección inteligente de encabezados"""
+def analizar_csv(ruta: str, callback: Optional[Callable] = None,
+                 tamaño_bytes: Optional[int] = None) -> Dict:
+    """Analiza archivo CSV por bloques con detección inteligente de encabezados"""
     import csv
     
     resultado = {
@@ -183,61 +239,53 @@ def analizar_csv(ruta: str, callback: Optional[Callable] = None) -> Dict:
         'ruta': ruta,
         'columnas': [],
         'total_filas': 0,
-        'tamaño_bytes': os.path.getsize(ruta),
+        'tamaño_bytes': os.path.getsize(ruta) if tamaño_bytes is None else tamaño_bytes,
         'muestra_valores': {},
+        'muestra_str': {},
         'tipos_detectados': {},
         'fila_encabezado': 1
     }
     
-    valores_unicos = {}  # Para trackear valores únicos por columna
-    
     try:
+        # Detectar delimitador sobre los bytes crudos
+        with open(ruta, 'rb') as fb:
+            sample = fb.read(_BYTES_MUESTRA_DELIMITADOR)
+        delimitador = _detectar_delimitador(sample, completo=len(sample) < _BYTES_MUESTRA_DELIMITADOR)
+        
         with open(ruta, 'r', encoding='utf-8', errors='replace', newline='') as f:
-            # Detectar delimitador
-            sample = f.read(8192)
-            f.seek(0)
+            reader = csv.reader(f, delimiter=delimitador)
             
-            try:
-                dialect = csv.Sniffer().sniff(sample)
-                reader = csv.reader(f, dialect)
-            except:
-                reader = csv.reader(f)
-            
-            # Leer primeras filas para detectar encabezados
+            # Leer primeras filas para detectar encabezados. Se guarda también
+            # la línea física donde termina cada fila (una celda entre comillas
+            # puede ocupar varias líneas)
             primeras_filas = []
+            fin_de_fila = []
             for i, row in enumerate(reader):
                 primeras_filas.append(row)
+                fin_de_fila.append(reader.line_num)
                 if i >= MAX_FILAS_BUSQUEDA_HEADER:
                     break
-            
-            if not primeras_filas:
-                return resultado
-            
-            # Buscar encabezados inteligentemente
-            idx_header, headers = _buscar_fila_encabezado(primeras_filas, callback)
-            resultado['fila_encabezado'] = idx_header + 1
-            resultado['columnas'] = headers
-            
-            for col in headers:
-                valores_unicos[col] = set()
-                resultado['tipos_detectados'][col] = 'texto'
-            
-            # Procesar filas después del encabezado (de las primeras leídas)
-            filas_leidas = 0
-            for row in primeras_filas[idx_header + 1:]:
-                filas_leidas += 1
-                _procesar_fila_datos(row, headers, valores_unicos, resultado, filas_leidas)
-            
-            # Continuar leyendo el resto del archivo
-            for row in reader:
-                filas_leidas += 1
-                _procesar_fila_datos(row, headers, valores_unicos, resultado, filas_leidas)
-                
-                if callback and filas_leidas % CHUNK_SIZE == 0:
-                    callback(f"CSV: {filas_leidas:,} filas procesadas...")
-            
-            resultado['total_filas'] = filas_leidas
-            resultado['muestra_valores'] = {k: list(v) for k, v in valores_unicos.items()}
+        
+        if not primeras_filas:
+            return resultado
+        
+        # Buscar encabezados inteligentemente
+        idx_header, headers = _buscar_fila_encabezado(primeras_filas, callback)
+        resultado['fila_encabezado'] = idx_header + 1
+        resultado['columnas'] = headers
+        
+        # El recorrido completo lo hace PyArrow (C++); si no está instalado
+        # o el archivo es irregular, se usa el lector csv de Python
+        try:
+            valores_unicos = _escanear_csv_arrow(ruta, delimitador, fin_de_fila[idx_header],
+                                                 headers, resultado, callback)
+        except Exception as e:
+            if callback and not isinstance(e, ImportError):
+                callback(f"CSV: PyArrow no pudo leer el archivo, usando lector estándar ({str(e)[:50]})")
+            valores_unicos = _escanear_csv_python(ruta, delimitador, idx_header, headers,
+                                                  resultado, callback)
+        
+        _materializar_muestras(resultado, valores_unicos)
             
     except Exception as e:
         resultado['error'] = str(e)
@@ -245,99 +293,210 @@ def analizar_csv(ruta: str, callback: Optional[Callable] = None) -> Dict:
     return resultado
 
 
+def _detectar_delimitador(sample: bytes, completo: bool = False) -> str:
+    """
+    Elige el delimitador que divide las líneas de forma más uniforme.
+    Puntaje = proporción de líneas con el conteo más frecuente × ese conteo.
+    Si la muestra no es el archivo completo, se descarta la última línea (cortada).
+    """
+    lineas = sample.split(b'\n')
+    if not completo:
+        lineas = lineas[:-1]
+    lineas = [l for l in lineas if l.strip()]
+    
+    mejor, mejor_score = ',', 0.0
+    for d in _DELIMITADORES:
+        conteos = [l.count(d) for l in lineas]
+        if not conteos:
+            continue
+        moda = max(set(conteos), key=conteos.count)
+        score = conteos.count(moda) / len(conteos) * moda
+        if score > mejor_score:
+            mejor, mejor_score = d.decode(), score
+    return mejor
+
+
+def _escanear_csv_arrow(ruta: str, delimitador: str, lineas_previas: int, headers: List,
+                        resultado: Dict, callback: Optional[Callable] = None) -> Dict:
+    """Cuenta filas y extrae muestra con el lector en streaming de PyArrow.
+    lineas_previas son las líneas físicas hasta el encabezado inclusive.
+    Los tipos se toman del esquema inferido por Arrow; las columnas que Arrow
+    deja como texto (decimales con coma, fechas dd/mm/aaaa) se revisan con
+    _detectar_tipo sobre las primeras filas."""
+    import pyarrow as pa
+    import pyarrow.csv as pac
+    
+    # Los encabezados ya vienen de la detección previa: Arrow solo lee datos
+    reader = pac.open_csv(
+        ruta,
+        read_options=pac.ReadOptions(use_threads=True, skip_rows=lineas_previas,
+                                     column_names=headers, block_size=16 << 20),
+        parse_options=pac.ParseOptions(delimiter=delimitador)
+    )
+
+    # Arrow no falla con texto que no es UTF-8 (cp1252, latin-1): la columna
+    # sale como binary. Se deja al lector csv, que reemplaza lo inválido
+    if any(pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type)
+           for field in reader.schema):
+        raise ValueError("columnas con texto no UTF-8")
+
+    tipos = {
+        col: _traducir_tipo_arrow(str(field.type))
+        for col, field in zip(headers, reader.schema)
+    }
+    resultado['tipos_detectados'] = tipos
+    valores_unicos = {col: [] for col in headers}
+    
+    filas_leidas = 0
+    for batch in reader:
+        if filas_leidas == 0:
+            # La muestra y la revisión de tipos salen del primer bloque
+            for i, col in enumerate(headers):
+                muestra = valores_unicos[col]
+                revisar_tipo = tipos[col] == 'texto'
+                for val in batch.column(i).slice(0, MAX_FILAS_DETECCION_TIPO).to_pylist():
+                    if len(muestra) >= MUESTRA_VALORES and not revisar_tipo:
+                        break
+                    if val is None:
+                        continue
+                    val_s = str(val)
+                    if not val_s.strip():
+                        continue
+                    if len(muestra) < MUESTRA_VALORES:
+                        corto = val_s[:50]
+                        if corto not in muestra:
+                            muestra.append(corto)
+                    if revisar_tipo:
+                        tipo = _detectar_tipo(val_s)
+                        if tipo != 'texto':
+                            tipos[col] = tipo
+                            revisar_tipo = False
+        
+        filas_leidas += batch.num_rows
+        if callback:
+            callback(f"CSV: {filas_leidas:,} filas procesadas...")
+    
+    resultado['total_filas'] = filas_leidas
+    return valores_unicos
+
+
+def _escanear_csv_python(ruta: str, delimitador: str, idx_header: int, headers: List,
+                         resultado: Dict, callback: Optional[Callable] = None) -> Dict:
+    """Recorrido fila a fila con el módulo csv (respaldo sin PyArrow)"""
+    import csv
+    
+    resultado['tipos_detectados'] = {col: 'texto' for col in headers}
+    valores_unicos = {col: [] for col in headers}
+    
+    with open(ruta, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        reader = csv.reader(f, delimiter=delimitador)
+        
+        # Saltar hasta el encabezado inclusive
+        for _ in range(idx_header + 1):
+            if next(reader, None) is None:
+                break
+        
+        cols_sample_done = [False] * len(headers)
+        cols_type_done = [False] * len(headers)
+        
+        filas_leidas = 0
+        for row in reader:
+            filas_leidas += 1
+            _procesar_fila_datos(row, headers, valores_unicos, resultado, filas_leidas,
+                                 cols_sample_done, cols_type_done)
+            
+            if callback and filas_leidas % CHUNK_SIZE == 0:
+                callback(f"CSV: {filas_leidas:,} filas procesadas...")
+    
+    resultado['total_filas'] = filas_leidas
+    return valores_unicos
+
+
 def _procesar_fila_datos(row: List, headers: List, valores_unicos: Dict, 
-                         resultado: Dict, fila_num: int):
-    """Procesa una fila de datos actualizando estadísticas"""
+                         resultado: Dict, fila_num: int,
+                         cols_sample_done: List[bool], cols_type_done: List[bool]):
+    """Procesa una fila de datos actualizando estadísticas.
+    Las columnas con muestra completa y tipo resuelto se omiten."""
     for i, val in enumerate(row):
-        if i < len(headers):
+        if i >= len(headers):
+            break
+        if cols_sample_done[i] and cols_type_done[i]:
+            continue
+        
+        # csv.reader ya entrega strings: no hace falta str() ni strip()
+        val_s = val if isinstance(val, str) else str(val)
+        if val_s:
             col = headers[i]
-            if val and str(val).strip():
-                # Muestrear valores
-                if len(valores_unicos[col]) < MUESTRA_VALORES:
-                    valores_unicos[col].add(str(val)[:50])
-                
-                # Detectar tipos en primeras filas
-                if fila_num <= 1000:
-                    tipo = _detectar_tipo(str(val))
-                    if resultado['tipos_detectados'][col] == 'texto' and tipo != 'texto':
+            
+            # Muestrear valores
+            if not cols_sample_done[i]:
+                muestra = valores_unicos[col]
+                corto = val_s[:50]
+                if corto not in muestra:
+                    muestra.append(corto)
+                if len(muestra) >= MUESTRA_VALORES:
+                    cols_sample_done[i] = True
+            
+            # Detectar tipos en primeras filas
+            if not cols_type_done[i]:
+                if fila_num > MAX_FILAS_DETECCION_TIPO:
+                    cols_type_done[i] = True
+                else:
+                    tipo = _detectar_tipo(val_s)
+                    if tipo != 'texto':
                         resultado['tipos_detectados'][col] = tipo
+                        cols_type_done[i] = True
 
 
-def analizar_excel(ruta: str, callback: Optional[Callable] = None) -> Dict:
-    """Analiza archivo Excel con detección inteligente de encabezados"""
+def _motor_excel() -> Optional[str]:
+    """Motor disponible para leer Excel: 'calamine', 'openpyxl' o None"""
+    try:
+        from python_calamine import CalamineWorkbook
+        # iter_rows y close llegan en python-calamine 0.3.0
+        if hasattr(CalamineWorkbook, 'close'):
+            return 'calamine'
+    except ImportError:
+        pass
     try:
         import openpyxl
+        return 'openpyxl'
     except ImportError:
+        return None
+
+
+def analizar_excel(ruta: str, callback: Optional[Callable] = None,
+                   tamaño_bytes: Optional[int] = None) -> Dict:
+    """Analiza archivo Excel con detección inteligente de encabezados.
+    Usa python-calamine (Rust) si está instalado; si no, openpyxl."""
+    motor = _motor_excel()
+    if motor is None:
         return {'error': 'Instala openpyxl: pip install openpyxl', 'ruta': ruta}
     
     resultado = {
         'tipo': 'Excel',
         'ruta': ruta,
         'hojas': [],
-        'tamaño_bytes': os.path.getsize(ruta)
+        'tamaño_bytes': os.path.getsize(ruta) if tamaño_bytes is None else tamaño_bytes
     }
     
     try:
-        # read_only=True para eficiencia de memoria
-        wb = openpyxl.load_workbook(ruta, read_only=True, data_only=True)
-        
-        for nombre_hoja in wb.sheetnames:
+        if motor == 'calamine':
+            from python_calamine import CalamineWorkbook
             if callback:
-                callback(f"Excel: Analizando hoja '{nombre_hoja}'...")
-            
-            ws = wb[nombre_hoja]
-            hoja_info = {
-                'nombre': nombre_hoja,
-                'columnas': [],
-                'total_filas': 0,
-                'muestra_valores': {},
-                'tipos_detectados': {},
-                'fila_encabezado': 1
-            }
-            
-            # Leer primeras filas para detectar encabezados
-            primeras_filas = []
-            todas_filas = []
-            
-            for row in ws.iter_rows(values_only=True):
-                todas_filas.append(list(row))
-                if len(primeras_filas) < MAX_FILAS_BUSQUEDA_HEADER:
-                    primeras_filas.append(list(row))
-            
-            if not primeras_filas:
-                resultado['hojas'].append(hoja_info)
-                continue
-            
-            # Buscar encabezados inteligentemente
-            idx_header, headers = _buscar_fila_encabezado(primeras_filas, callback)
-            hoja_info['fila_encabezado'] = idx_header + 1
-            hoja_info['columnas'] = headers
-            
-            valores_unicos = {col: set() for col in headers}
-            hoja_info['tipos_detectados'] = {col: 'texto' for col in headers}
-            
-            # Procesar datos después del encabezado
-            filas_datos = 0
-            for row in todas_filas[idx_header + 1:]:
-                filas_datos += 1
-                for i, val in enumerate(row):
-                    if i < len(headers):
-                        col = headers[i]
-                        if val is not None:
-                            if len(valores_unicos[col]) < MUESTRA_VALORES:
-                                valores_unicos[col].add(str(val)[:50])
-                            
-                            if filas_datos <= 1000:
-                                tipo = _detectar_tipo_valor(val)
-                                if hoja_info['tipos_detectados'][col] == 'texto' and tipo != 'texto':
-                                    hoja_info['tipos_detectados'][col] = tipo
-                
-                if callback and filas_datos % CHUNK_SIZE == 0:
-                    callback(f"Excel [{nombre_hoja}]: {filas_datos:,} filas...")
-            
-            hoja_info['total_filas'] = filas_datos
-            hoja_info['muestra_valores'] = {k: list(v) for k, v in valores_unicos.items()}
-            resultado['hojas'].append(hoja_info)
+                callback("Excel: usando motor calamine")
+            wb = CalamineWorkbook.from_path(ruta)
+            for nombre_hoja in wb.sheet_names:
+                rows_iter = _filas_calamine(wb.get_sheet_by_name(nombre_hoja).iter_rows())
+                resultado['hojas'].append(_analizar_hoja(nombre_hoja, rows_iter, callback))
+        else:
+            import openpyxl
+            if callback:
+                callback("Excel: usando motor openpyxl")
+            # read_only=True para eficiencia de memoria
+            wb = openpyxl.load_workbook(ruta, read_only=True, data_only=True)
+            for ws in wb.worksheets:
+                rows_iter = ws.iter_rows(values_only=True)
+                resultado['hojas'].append(_analizar_hoja(ws.title, rows_iter, callback))
         
         wb.close()
         
@@ -347,7 +506,74 @@ def analizar_excel(ruta: str, callback: Optional[Callable] = None) -> Dict:
     return resultado
 
 
-def analizar_parquet(ruta: str, callback: Optional[Callable] = None) -> Dict:
+def _filas_calamine(rows_iter):
+    """Adapta las filas de calamine al formato de openpyxl:
+    celdas vacías como None y números enteros como int"""
+    for row in rows_iter:
+        yield [None if val == '' else
+               int(val) if isinstance(val, float) and val.is_integer() else val
+               for val in row]
+
+
+def _analizar_hoja(nombre_hoja: str, rows_iter, callback: Optional[Callable] = None) -> Dict:
+    """Analiza una hoja a partir de un iterador de filas (tuplas de valores)"""
+    if callback:
+        callback(f"Excel: Analizando hoja '{nombre_hoja}'...")
+    
+    hoja_info = {
+        'nombre': nombre_hoja,
+        'columnas': [],
+        'total_filas': 0,
+        'muestra_valores': {},
+        'muestra_str': {},
+        'tipos_detectados': {},
+        'fila_encabezado': 1
+    }
+    
+    # Leer primeras filas para detectar encabezados; el resto se
+    # consume del mismo generador sin cargar la hoja en memoria
+    primeras_filas = list(itertools.islice(rows_iter, MAX_FILAS_BUSQUEDA_HEADER))
+    
+    if not primeras_filas:
+        return hoja_info
+    
+    # Buscar encabezados inteligentemente
+    idx_header, headers = _buscar_fila_encabezado(primeras_filas, callback)
+    hoja_info['fila_encabezado'] = idx_header + 1
+    hoja_info['columnas'] = headers
+    
+    valores_unicos = {col: [] for col in headers}
+    hoja_info['tipos_detectados'] = {col: 'texto' for col in headers}
+    
+    # Procesar datos después del encabezado
+    filas_datos = 0
+    for row in itertools.chain(primeras_filas[idx_header + 1:], rows_iter):
+        filas_datos += 1
+        for i, val in enumerate(row):
+            if i < len(headers):
+                col = headers[i]
+                if val is not None:
+                    muestra = valores_unicos[col]
+                    if len(muestra) < MUESTRA_VALORES:
+                        val_s = str(val)[:50]
+                        if val_s not in muestra:
+                            muestra.append(val_s)
+                    
+                    if filas_datos <= 1000:
+                        tipo = _detectar_tipo_valor(val)
+                        if hoja_info['tipos_detectados'][col] == 'texto' and tipo != 'texto':
+                            hoja_info['tipos_detectados'][col] = tipo
+        
+        if callback and filas_datos % CHUNK_SIZE == 0:
+            callback(f"Excel [{nombre_hoja}]: {filas_datos:,} filas...")
+    
+    hoja_info['total_filas'] = filas_datos
+    _materializar_muestras(hoja_info, valores_unicos)
+    return hoja_info
+
+
+def analizar_parquet(ruta: str, callback: Optional[Callable] = None,
+                     tamaño_bytes: Optional[int] = None) -> Dict:
     """Analiza archivo Parquet usando solo PyArrow (sin pandas)"""
     try:
         import pyarrow.parquet as pq
@@ -360,8 +586,9 @@ def analizar_parquet(ruta: str, callback: Optional[Callable] = None) -> Dict:
         'ruta': ruta,
         'columnas': [],
         'total_filas': 0,
-        'tamaño_bytes': os.path.getsize(ruta),
+        'tamaño_bytes': os.path.getsize(ruta) if tamaño_bytes is None else tamaño_bytes,
         'muestra_valores': {},
+        'muestra_str': {},
         'tipos_detectados': {}
     }
     
@@ -369,8 +596,9 @@ def analizar_parquet(ruta: str, callback: Optional[Callable] = None) -> Dict:
         if callback:
             callback("Parquet: Leyendo metadata...")
         
-        # Leer solo metadata primero (muy eficiente)
-        parquet_file = pq.ParquetFile(ruta)
+        # Leer solo metadata primero (muy eficiente); memory_map deja la
+        # paginación del archivo al sistema operativo
+        parquet_file = pq.ParquetFile(ruta, memory_map=True)
         metadata = parquet_file.metadata
         schema = parquet_file.schema_arrow
         
@@ -378,42 +606,54 @@ def analizar_parquet(ruta: str, callback: Optional[Callable] = None) -> Dict:
         resultado['columnas'] = [field.name for field in schema]
         resultado['tipos_detectados'] = {field.name: _traducir_tipo_arrow(str(field.type)) for field in schema}
         
-        # Leer muestra de valores usando PyArrow puro (sin pandas)
+        # Muestra de valores desde estadísticas (sin decodificar datos)
         if callback:
             callback("Parquet: Extrayendo muestra de valores...")
         
-        valores_unicos = {col: set() for col in resultado['columnas']}
+        valores_unicos = {col: [] for col in resultado['columnas']}
         
-        # Leer solo las primeras filas para muestra (más eficiente)
         try:
-            # Leer un batch pequeño
-            for batch in parquet_file.iter_batches(batch_size=min(1000, CHUNK_SIZE)):
+            if metadata.num_row_groups > 0:
+                # Usar min/max de las estadísticas del primer row group:
+                # se leen de la metadata sin descomprimir páginas
+                rg0 = metadata.row_group(0)
+                sin_estadisticas = []
+                stats_por_columna = {}
+                for j in range(rg0.num_columns):
+                    col_meta = rg0.column(j)
+                    stats_por_columna[col_meta.path_in_schema] = col_meta.statistics
+                
                 for col_name in resultado['columnas']:
-                    if len(valores_unicos[col_name]) >= MUESTRA_VALORES:
-                        continue
-                    
-                    try:
-                        col_idx = batch.schema.get_field_index(col_name)
-                        column = batch.column(col_idx)
-                        
-                        # Extraer valores como Python nativos
-                        for i in range(min(len(column), MUESTRA_VALORES * 2)):
-                            if len(valores_unicos[col_name]) >= MUESTRA_VALORES:
-                                break
-                            val = column[i].as_py()
-                            if val is not None:
-                                valores_unicos[col_name].add(str(val)[:50])
-                    except Exception:
-                        continue
+                    stats = stats_por_columna.get(col_name)
+                    if stats is not None and stats.has_min_max:
+                        minimo, maximo = str(stats.min)[:50], str(stats.max)[:50]
+                        valores_unicos[col_name] = [minimo] if minimo == maximo else [minimo, maximo]
+                    else:
+                        sin_estadisticas.append(col_name)
                 
-                # Solo necesitamos un batch para muestra
-                break
+                # Solo las columnas sin estadísticas se decodifican: un único
+                # lote pequeño, proyectado a esas columnas
+                if sin_estadisticas:
+                    batch = next(parquet_file.iter_batches(batch_size=MUESTRA_VALORES * 2,
+                                                           columns=sin_estadisticas,
+                                                           use_threads=True), None)
+                    if batch is not None:
+                        for col_name in sin_estadisticas:
+                            columna = batch.column(batch.schema.get_field_index(col_name))
+                            muestra = valores_unicos[col_name]
+                            for val in columna.to_pylist():
+                                if len(muestra) >= MUESTRA_VALORES:
+                                    break
+                                if val is not None:
+                                    val_s = str(val)[:50]
+                                    if val_s not in muestra:
+                                        muestra.append(val_s)
                 
         except Exception as e:
             if callback:
                 callback(f"Parquet: Nota - no se pudo extraer muestra: {str(e)[:50]}")
         
-        resultado['muestra_valores'] = {k: list(v) for k, v in valores_unicos.items()}
+        _materializar_muestras(resultado, valores_unicos)
         
     except Exception as e:
         resultado['error'] = str(e)
@@ -433,37 +673,40 @@ def _traducir_tipo_arrow(tipo_arrow: str) -> str:
         return 'fecha'
     elif 'bool' in tipo_lower:
         return 'booleano'
-    elif 'string' in tipo_lower or 'utf8' in tipo_lower:
+    elif 'string' in tipo_lower or 'utf8' in tipo_lower or tipo_lower == 'null':
         return 'texto'
     else:
         return tipo_arrow  # Mantener el original si no se reconoce
 
 
 def _detectar_tipo(valor_str: str) -> str:
-    """Detecta el tipo de dato de un string"""
-    if not valor_str or valor_str.strip() == '':
+    """Detecta el tipo de dato de un string clasificando sus caracteres
+    en una sola pasada (sin excepciones ni strings intermedios)"""
+    s = valor_str.strip()
+    if not s:
         return 'texto'
     
-    # Intentar número entero
-    try:
-        int(valor_str.replace(',', '').replace('.', '').strip())
-        if '.' in valor_str or ',' in valor_str:
-            return 'decimal'
-        return 'entero'
-    except:
-        pass
+    digitos = separadores = guiones = barras = otros = 0
+    for c in s:
+        if c.isdigit():
+            digitos += 1
+        elif c == '.' or c == ',':
+            separadores += 1
+        elif c == '-':
+            guiones += 1
+        elif c == '/':
+            barras += 1
+        else:
+            otros += 1
     
-    # Intentar decimal
-    try:
-        float(valor_str.replace(',', '.').strip())
-        return 'decimal'
-    except:
-        pass
+    # Número: solo dígitos y separadores, con signo opcional al inicio
+    signo = 1 if s[0] == '-' else 0
+    if digitos and not otros and not barras and guiones == signo:
+        return 'decimal' if separadores else 'entero'
     
-    # Intentar fecha
-    if any(sep in valor_str for sep in ['/', '-']) and len(valor_str) <= 20:
-        if any(c.isdigit() for c in valor_str):
-            return 'fecha'
+    # Fecha: al menos dos separadores de fecha (dd/mm/aaaa, aaaa-mm-dd ...)
+    if digitos >= 2 and (barras >= 2 or guiones >= 2) and len(s) <= 20:
+        return 'fecha'
     
     return 'texto'
 
@@ -479,7 +722,7 @@ def _detectar_tipo_valor(valor) -> str:
         return 'entero'
     elif tipo in ('float', 'float64', 'float32'):
         return 'decimal'
-    elif tipo == 'datetime':
+    elif tipo in ('datetime', 'date'):
         return 'fecha'
     elif tipo == 'bool':
         return 'booleano'
@@ -487,10 +730,42 @@ def _detectar_tipo_valor(valor) -> str:
     return 'texto'
 
 
+def _recorrer_datos(raiz: str):
+    """Genera (ruta, tamaño) de los archivos de datos bajo raiz (os.scandir recursivo).
+    El tamaño sale del DirEntry, que en Windows ya viene sin stat adicional."""
+    try:
+        with os.scandir(raiz) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in _CARPETAS_EXCLUIDAS:
+                        continue
+                    yield from _recorrer_datos(entry.path)
+                elif entry.name.lower().endswith(_EXTENSIONES_DATOS):
+                    try:
+                        tamaño = entry.stat().st_size
+                    except OSError:
+                        tamaño = None
+                    yield entry.path, tamaño
+    except OSError:
+        return
+
+
+def _analizar_archivo(ruta: str, tamaño_bytes: Optional[int] = None) -> Optional[Dict]:
+    """Analiza un archivo según su extensión (se ejecuta en un proceso del pool)"""
+    ext = os.path.splitext(ruta)[1].lower()
+    if ext == '.csv':
+        return analizar_csv(ruta, tamaño_bytes=tamaño_bytes)
+    elif ext in ('.xlsx', '.xls'):
+        return analizar_excel(ruta, tamaño_bytes=tamaño_bytes)
+    elif ext in ('.parquet', '.pq'):
+        return analizar_parquet(ruta, tamaño_bytes=tamaño_bytes)
+    return None
+
+
 def generar_reporte_datos(ruta_directorio: str, archivo_salida: str = "mapa_datos",
                           carpeta_salida: Optional[str] = None,
                           callback: Optional[Callable] = None,
-                          formato: str = 'pdf') -> Dict:
+                          formato: str = 'pdf', verbose: bool = False) -> Dict:
     """
     Escanea directorio buscando archivos de datos y genera reporte.
     
@@ -500,18 +775,16 @@ def generar_reporte_datos(ruta_directorio: str, archivo_salida: str = "mapa_dato
         carpeta_salida: Carpeta donde guardar el reporte (None = misma que ruta_directorio)
         callback: Función para reportar progreso
         formato: Formato de salida ('pdf', 'txt', 'csv')
+        verbose: Si True, también imprime los mensajes por consola (uso CLI)
     
     Returns:
         Dict con resumen del análisis
     """
-    extensiones_datos = {'.csv', '.xlsx', '.xls', '.parquet', '.pq'}
-    archivos_encontrados = []
-    resultados = []
-    
     def log(msg):
         if callback:
             callback(msg)
-        print(msg)
+        if verbose:
+            print(msg)
     
     # 0. Normalizar rutas
     ruta_directorio = os.path.normpath(os.path.abspath(ruta_directorio))
@@ -523,45 +796,47 @@ def generar_reporte_datos(ruta_directorio: str, archivo_salida: str = "mapa_dato
     log(f"Buscando archivos de datos en: {ruta_directorio}")
     
     # Buscar archivos
-    for root, dirs, files in os.walk(ruta_directorio):
-        # Ignorar carpetas comunes
-        dirs[:] = [d for d in dirs if d not in {'.git', '__pycache__', 'node_modules', 'venv', '.venv'}]
-        
-        for f in files:
-            ext = os.path.splitext(f)[1].lower()
-            if ext in extensiones_datos:
-                archivos_encontrados.append(os.path.join(root, f))
+    archivos_encontrados = list(_recorrer_datos(ruta_directorio))
     
     log(f"Encontrados {len(archivos_encontrados)} archivos de datos")
     
-    # Analizar cada archivo
-    for i, ruta in enumerate(archivos_encontrados):
-        ext = os.path.splitext(ruta)[1].lower()
-        nombre = os.path.basename(ruta)
-        log(f"[{i+1}/{len(archivos_encontrados)}] Analizando: {nombre}")
-        
-        try:
-            if ext == '.csv':
-                resultado = analizar_csv(ruta, callback)
-            elif ext in ('.xlsx', '.xls'):
-                resultado = analizar_excel(ruta, callback)
-            elif ext in ('.parquet', '.pq'):
-                resultado = analizar_parquet(ruta, callback)
-            else:
-                continue
-            
-            resultados.append(resultado)
-            
-        except Exception as e:
-            log(f"Error analizando {nombre}: {e}")
-            resultados.append({'ruta': ruta, 'error': str(e)})
+    # Los análisis corren en otros procesos sin callback: el motor de Excel
+    # se informa desde aquí
+    if any(ruta.lower().endswith(('.xlsx', '.xls')) for ruta, _ in archivos_encontrados):
+        motor = _motor_excel()
+        if motor:
+            log(f"Excel: usando motor {motor}")
+    
+    # Analizar archivos en paralelo: cada archivo es independiente
+    total = len(archivos_encontrados)
+    por_ruta = {}
+    if archivos_encontrados:
+        # 'spawn': la GUI puede tener otros hilos activos (lectores del PDF de
+        # código) y hacer fork de un proceso con hilos puede bloquear los
+        # procesos hijos. Es además el modo de Windows/PyInstaller
+        with ProcessPoolExecutor(max_workers=min(total, _MAX_PROCESOS),
+                                 mp_context=multiprocessing.get_context('spawn')) as ex:
+            futures = {ex.submit(_analizar_archivo, ruta, tamaño): ruta
+                       for ruta, tamaño in archivos_encontrados}
+            for i, fut in enumerate(as_completed(futures), 1):
+                ruta = futures[fut]
+                nombre = os.path.basename(ruta)
+                try:
+                    por_ruta[ruta] = fut.result()
+                    log(f"[{i}/{total}] Analizado: {nombre}")
+                except Exception as e:
+                    log(f"Error analizando {nombre}: {e}")
+                    por_ruta[ruta] = {'ruta': ruta, 'error': str(e)}
+    
+    # Mantener el orden del escaneo en el reporte
+    resultados = [por_ruta[ruta] for ruta, _ in archivos_encontrados if por_ruta[ruta] is not None]
     
     # Generar reporte según formato
     
     # Crear carpeta de salida si no existe
     if not os.path.exists(carpeta_salida):
         try:
-            os.makedirs(carpeta_salida)
+            os.makedirs(carpeta_salida, exist_ok=True)
         except OSError as e:
             log(f"Error creando carpeta de salida: {e}")
             return {'error': str(e)}
@@ -640,55 +915,52 @@ def _generar_reporte_pdf(resultados: List[Dict], ruta_salida: str, log: Callable
     
     pdf.output(ruta_salida)
     
-    if os.path.exists(ruta_salida):
-            log(f"Reporte PDF guardado en: {ruta_salida}")
-    else:
-            log(f"Error CRÍTICO: El reporte no aparece en {ruta_salida}")
+    log(f"Reporte PDF guardado en: {ruta_salida}")
 
 
 def _generar_reporte_txt(resultados: List[Dict], ruta_salida: str, log: Callable):
-    """Genera el reporte en formato TXT"""
-    with open(ruta_salida, 'w', encoding='utf-8') as f:
-        f.write("MAPA DE ARCHIVOS DE DATOS\n")
-        f.write("=========================\n\n")
-        
-        for res in resultados:
+    """Genera el reporte en formato TXT.
+    El texto se acumula en una lista y se vuelca cada 10 archivos en una sola escritura."""
+    partes = ["MAPA DE ARCHIVOS DE DATOS\n", "=========================\n\n"]
+    
+    with open(ruta_salida, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for i, res in enumerate(resultados):
+            if i and i % 10 == 0:
+                f.write(''.join(partes))
+                partes.clear()
+            
             nombre = os.path.basename(res.get('ruta', 'N/A'))
             tipo = res.get('tipo', 'Desconocido')
             ruta = res.get('ruta', 'N/A')
             
-            f.write(f"ARCHIVO: {nombre}\n")
-            f.write(f"Tipo: {tipo}\n")
-            f.write(f"Ruta: {ruta}\n")
+            partes.append(f"ARCHIVO: {nombre}\nTipo: {tipo}\nRuta: {ruta}\n")
             
             if 'error' in res:
-                f.write(f"ERROR: {res['error']}\n\n")
+                partes.append(f"ERROR: {res['error']}\n\n")
                 continue
             
             tamaño = res.get('tamaño_bytes', 0)
-            f.write(f"Tamaño: {_formato_bytes(tamaño)}\n")
+            partes.append(f"Tamaño: {_formato_bytes(tamaño)}\n")
             
             if 'hojas' in res:
                 for hoja in res['hojas']:
-                    f.write(f"\n  HOJA: {hoja['nombre']}\n")
-                    f.write(f"  Encabezados en fila: {hoja.get('fila_encabezado', 1)}\n")
-                    f.write(f"  Filas de datos: {hoja.get('total_filas', 0):,}\n")
-                    f.write(f"  Columnas ({len(hoja.get('columnas', []))}):\n")
-                    _escribir_columnas(f, hoja, indent="    ")
+                    partes.append(f"\n  HOJA: {hoja['nombre']}\n"
+                                  f"  Encabezados en fila: {hoja.get('fila_encabezado', 1)}\n"
+                                  f"  Filas de datos: {hoja.get('total_filas', 0):,}\n"
+                                  f"  Columnas ({len(hoja.get('columnas', []))}):\n")
+                    _escribir_columnas(partes, hoja, indent="    ")
             else:
-                f.write(f"Encabezados en fila: {res.get('fila_encabezado', 1)}\n")
-                f.write(f"Filas de datos: {res.get('total_filas', 0):,}\n")
-                f.write(f"Columnas ({len(res.get('columnas', []))}):\n")
-                _escribir_columnas(f, res)
-            
-            f.write("\n" + "-"*50 + "\n\n")
+                partes.append(f"Encabezados en fila: {res.get('fila_encabezado', 1)}\n"
+                              f"Filas de datos: {res.get('total_filas', 0):,}\n"
+                              f"Columnas ({len(res.get('columnas', []))}):\n")
+                _escribir_columnas(partes, res)
             
-        f.write(f"Total archivos analizados: {len(resultados)}\n")
+            partes.append("\n" + "-"*50 + "\n\n")
         
-    if os.path.exists(ruta_salida):
-        log(f"Reporte TXT guardado en: {ruta_salida}")
-    else:
-        log(f"Error CRÍTICO: El reporte no aparece en {ruta_salida}")
+        partes.append(f"Total archivos analizados: {len(resultados)}\n")
+        f.write(''.join(partes))
+        
+    log(f"Reporte TXT guardado en: {ruta_salida}")
 
 
 def _generar_reporte_csv(resultados: List[Dict], ruta_salida: str, log: Callable):
@@ -719,7 +991,10 @@ def _generar_reporte_csv(resultados: List[Dict], ruta_salida: str, log: Callable
                 writer.writerow(base_info)
                 continue
             
-            # Helper para escribir columnas
+            # Las filas de cada archivo se acumulan y se escriben de una vez
+            filas = []
+            
+            # Helper para generar filas de columnas
             def escribir_cols(columns_data, hoja_nom=''):
                 columnas = columns_data.get('columnas', [])
                 tipos = columns_data.get('tipos_detectados', {})
@@ -732,7 +1007,7 @@ def _generar_reporte_csv(resultados: List[Dict], ruta_salida: str, log: Callable
                         'total_filas': columns_data.get('total_filas', 0),
                         'total_columnas': 0
                     })
-                    writer.writerow(row)
+                    filas.append(row)
                     return
 
                 for col in columnas:
@@ -748,65 +1023,69 @@ def _generar_reporte_csv(resultados: List[Dict], ruta_salida: str, log: Callable
                         'columna_tipo_detectado': tipos.get(col, 'texto'),
                         'ejemplo_valores': muestra_str
                     })
-                    writer.writerow(row)
+                    filas.append(row)
             
             if 'hojas' in res:
                 for hoja in res['hojas']:
                     escribir_cols(hoja, hoja['nombre'])
             else:
                 escribir_cols(res)
+            
+            writer.writerows(filas)
 
-    if os.path.exists(ruta_salida):
-        log(f"Reporte CSV guardado en: {ruta_salida}")
-    else:
-        log(f"Error CRÍTICO: El reporte no aparece en {ruta_salida}")
+    log(f"Reporte CSV guardado en: {ruta_salida}")
 
 
 def _escribir_columnas_pdf(pdf, datos: Dict):
     """Escribe información de columnas al PDF"""
     columnas = datos.get('columnas', [])
     tipos = datos.get('tipos_detectados', {})
-    muestras = datos.get('muestra_valores', {})
+    muestras_str = datos.get('muestra_str', {})
     
     for col in columnas:
         tipo = tipos.get(col, 'texto')
-        muestra = muestras.get(col, [])
-        muestra_str = ", ".join(muestra[:3]) if muestra else "(vacio)"
+        muestra_str = muestras_str.get(col) or "(vacio)"
         if len(muestra_str) > 50:
             muestra_str = muestra_str[:47] + "..."
         pdf.columna(col, tipo, muestra_str)
 
 
-def _escribir_columnas(f, datos: Dict, indent: str = "  "):
-    """Escribe información de columnas al archivo"""
+def _escribir_columnas(partes: List[str], datos: Dict, indent: str = "  "):
+    """Agrega las líneas de información de columnas a la lista de partes"""
     columnas = datos.get('columnas', [])
     tipos = datos.get('tipos_detectados', {})
-    muestras = datos.get('muestra_valores', {})
+    muestras_str = datos.get('muestra_str', {})
     
     for col in columnas:
         tipo = tipos.get(col, 'texto')
-        muestra = muestras.get(col, [])
-        muestra_str = ", ".join(muestra[:3]) if muestra else "(vacío)"
-        if len(muestra_str) > 60:
-            muestra_str = muestra_str[:57] + "..."
-        f.write(f"{indent}- {col} [{tipo}]: {muestra_str}\n")
+        muestra_str = muestras_str.get(col) or "(vacío)"
+        partes.append(f"{indent}- {col} [{tipo}]: {muestra_str}\n")
+
+
+def _resumir_muestra(valores: List[str]) -> str:
+    """Texto corto con los primeros valores de muestra ('' si no hay)"""
+    muestra_str = ", ".join(valores[:3])
+    if len(muestra_str) > 60:
+        muestra_str = muestra_str[:57] + "..."
+    return muestra_str
+
+
+def _materializar_muestras(info: Dict, valores_unicos: Dict):
+    """Guarda la muestra de valores y su texto resumido (se calcula una sola vez)"""
+    info['muestra_valores'] = {k: list(v) for k, v in valores_unicos.items()}
+    info['muestra_str'] = {k: _resumir_muestra(v) for k, v in info['muestra_valores'].items()}
 
 
 def _formato_bytes(bytes_num: int) -> str:
-    """Formatea bytes a unidad legible"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_num < 1024:
-            return f"{bytes_num:.1f} {unit}"
-        bytes_num /= 1024
-    return f"{bytes_num:.1f} TB"
+    """Formatea bytes a unidad legible (unidad elegida por bit_length, sin bucle)"""
+    idx = min(len(_UNIDADES_BYTES) - 1, max(0, (int(bytes_num).bit_length() - 1) // 10))
+    return f"{bytes_num / (1 << (10 * idx)):.1f} {_UNIDADES_BYTES[idx]}"
 
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) > 1:
         directorio = sys.argv[1]
     else:
         directorio = "."
     
-    generar_reporte_datos(directorio)
+    generar_reporte_datos(directorio, verbose=True)
@@ -6,12 +6,18 @@ Aplicación con GUI usando tkinter
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import multiprocessing
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from extractor import generar_arbol_y_extraer, EXTENSIONES_CODIGO
 from analizador_datos import generar_reporte_datos
 
 
+INTERVALO_LOG_MS = 100  # Cada cuánto se vuelcan al log los mensajes del proceso
+
+
 class InvestigadorApp:
     def __init__(self, root):
         self.root = root
@@ -27,6 +33,12 @@ class InvestigadorApp:
         
         self.crear_widgets()
         
+        # Mensajes del hilo de trabajo pendientes de mostrar. El hilo solo hace
+        # append (seguro con el GIL) y la UI los vuelca en bloque con un timer,
+        # en vez de encolar un evento de Tk por cada línea
+        self._cola_log = deque()
+        self.root.after(INTERVALO_LOG_MS, self._vaciar_log_periodico)
+        
     def crear_widgets(self):
         # Frame principal con padding
         main_frame = ttk.Frame(self.root, padding="20")
@@ -232,6 +244,19 @@ class InvestigadorApp:
         self.log_text.insert(tk.END, mensaje + "\n")
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
+    
+    def _volcar_log(self):
+        """Mostrar de una vez todos los mensajes pendientes del hilo de trabajo"""
+        if not self._cola_log:
+            return
+        mensajes = []
+        while self._cola_log:
+            mensajes.append(self._cola_log.popleft())
+        self.log("\n".join(mensajes))
+    
+    def _vaciar_log_periodico(self):
+        self._volcar_log()
+        self.root.after(INTERVALO_LOG_MS, self._vaciar_log_periodico)
         
     def iniciar_proceso(self):
         directorio = self.directorio_var.get().strip()
@@ -254,6 +279,7 @@ class InvestigadorApp:
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
+        self._cola_log.clear()
         
         # Ejecutar en hilo separado para no bloquear la UI
         thread = threading.Thread(target=self.ejecutar_extraccion, daemon=True)
@@ -278,51 +304,64 @@ class InvestigadorApp:
         # Determinar extensiones a usar
         extensiones = EXTENSIONES_CODIGO if (generar_pdf and solo_codigo) else None
         
-        def callback_log(mensaje):
-            self.root.after(0, lambda: self.log(mensaje))
+        callback_log = self._cola_log.append
         
         resultado = None
         resultado_datos = None
         
         try:
-            # Generar mapa de directorios y/o PDF de código
-            if generar_mapa or generar_pdf:
-                resultado = generar_arbol_y_extraer(
-                    directorio,
-                    nombre_pdf=nombre_pdf,
-                    nombre_mapa=nombre_mapa,
-                    callback=callback_log,
-                    generar_mapa=generar_mapa,
-                    generar_pdf=generar_pdf,
-                    extensiones_codigo=extensiones,
-                    carpeta_salida=carpeta_salida
-                )
-            
-            # Generar mapa de archivos de datos
-            if generar_mapa_datos:
-                self.root.after(0, lambda: self.log(f"\n📊 Iniciando análisis de archivos de datos (Salida: {formato_datos})..."))
-                resultado_datos = generar_reporte_datos(
-                    directorio,
-                    archivo_salida=f"mapa_datos",
-                    carpeta_salida=carpeta_salida,
-                    callback=callback_log,
-                    formato=formato_datos
-                )
+            # Ambas tareas recorren el mismo directorio de forma independiente
+            # y pasan casi todo el tiempo en E/S: se ejecutan a la vez
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                futuro = None
+                futuro_datos = None
+                
+                # Generar mapa de directorios y/o PDF de código
+                if generar_mapa or generar_pdf:
+                    futuro = ex.submit(
+                        generar_arbol_y_extraer,
+                        directorio,
+                        nombre_pdf=nombre_pdf,
+                        nombre_mapa=nombre_mapa,
+                        callback=callback_log,
+                        generar_mapa=generar_mapa,
+                        generar_pdf=generar_pdf,
+                        extensiones_codigo=extensiones,
+                        carpeta_salida=carpeta_salida
+                    )
+                
+                # Generar mapa de archivos de datos
+                if generar_mapa_datos:
+                    callback_log(f"\n📊 Iniciando análisis de archivos de datos (Salida: {formato_datos})...")
+                    futuro_datos = ex.submit(
+                        generar_reporte_datos,
+                        directorio,
+                        archivo_salida=f"mapa_datos",
+                        carpeta_salida=carpeta_salida,
+                        callback=callback_log,
+                        formato=formato_datos
+                    )
+                
+                if futuro is not None:
+                    resultado = futuro.result()
+                if futuro_datos is not None:
+                    resultado_datos = futuro_datos.result()
             
             # Mostrar resultados
             if resultado or resultado_datos:
                 self.root.after(0, lambda: self.mostrar_resultado(resultado, resultado_datos))
             else:
-                self.root.after(0, lambda: self.log("❌ Error durante el proceso"))
+                callback_log("❌ Error durante el proceso")
                 
         except Exception as e:
-            self.root.after(0, lambda: self.log(f"❌ Error: {str(e)}"))
+            callback_log(f"❌ Error: {str(e)}")
             self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
         finally:
             self.root.after(0, self.finalizar_proceso)
             
     def mostrar_resultado(self, resultado=None, resultado_datos=None):
         """Mostrar estadísticas del resultado"""
+        self._volcar_log()
         mensajes = []
         
         # Resultados de código/estructura
@@ -365,6 +404,7 @@ class InvestigadorApp:
         
     def finalizar_proceso(self):
         """Restaurar estado de la UI después del proceso"""
+        self._volcar_log()
         self.progreso.stop()
         self.btn_generar.config(state=tk.NORMAL)
 
@@ -383,4 +423,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Necesario para el pool de procesos en el ejecutable (PyInstaller)
+    multiprocessing.freeze_support()
     main()
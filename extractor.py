@@ -3,15 +3,19 @@ Extractor de Código Fuente a PDF
 Genera: mapa de directorios, reporte de distribución y PDF consolidado
 """
 
+import codecs
+import itertools
 import os
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from fpdf import FPDF
 
 # CONFIGURACIÓN POR DEFECTO
-EXTENSIONES_IGNORADAS = {'.exe', '.dll', '.png', '.jpg', '.jpeg', '.pyc', '.git', '.zip', '.pdf', '.ico', '.gif', '.bmp', '.mp3', '.mp4', '.avi', '.mov', '.db', '.sqlite'}
-CARPETAS_IGNORADAS = {'.git', '__pycache__', 'node_modules', 'venv', '.idea', '.vscode', 'env', '.env', 'dist', 'build', '.pytest_cache', '.mypy_cache'}
+EXTENSIONES_IGNORADAS = frozenset({'.exe', '.dll', '.png', '.jpg', '.jpeg', '.pyc', '.git', '.zip', '.pdf', '.ico', '.gif', '.bmp', '.mp3', '.mp4', '.avi', '.mov', '.db', '.sqlite'})
+CARPETAS_IGNORADAS = frozenset({'.git', '__pycache__', 'node_modules', 'venv', '.idea', '.vscode', 'env', '.env', 'dist', 'build', '.pytest_cache', '.mypy_cache'})
 
 # Extensiones de código fuente (para filtrar en PDF)
-EXTENSIONES_CODIGO = {
+EXTENSIONES_CODIGO = frozenset({
     '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.c', '.cpp', '.h', '.hpp',
     '.cs', '.go', '.rs', '.rb', '.php', '.swift', '.kt', '.scala', '.r',
     '.sql', '.html', '.css', '.scss', '.sass', '.less', '.vue', '.svelte',
@@ -19,10 +23,23 @@ EXTENSIONES_CODIGO = {
     '.sh', '.bash', '.ps1', '.bat', '.cmd', '.dockerfile',
     '.md', '.rst', '.txt', '.gitignore', '.env.example',
     '.gradle', '.maven', '.cmake', '.makefile'
-}
+})
+
+HILOS_LECTURA = 16  # Lecturas de archivos simultáneas para el PDF
+VENTANA_LECTURA = HILOS_LECTURA * 2  # Máximo de archivos leídos por adelantado
+INTERVALO_PROGRESO = 100  # Cada cuántos archivos se reporta el progreso del PDF
+MAX_BYTES_CODIGO = 2_000_000  # En modo "solo código", más grande no es código fuente
+BYTES_SONDEO_TEXTO = 4096  # Inicio del archivo que debe ser UTF-8 válido para incluirlo
+ANCHO_LINEA_CODIGO = 110  # Caracteres por línea de código (Courier 8 en A4)
 
 
 class PDFGenerator(FPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Único color de relleno del documento: add_page lo restaura tras
+        # cada salto de página, así que no hace falta fijarlo por archivo
+        self.set_fill_color(200, 220, 255)
+
     def header(self):
         self.set_font('Arial', 'B', 10)
         self.cell(0, 10, 'Documentación de Código Fuente', 0, 1, 'C')
@@ -34,15 +51,28 @@ class PDFGenerator(FPDF):
 
     def chapter_title(self, title):
         self.set_font('Arial', 'B', 12)
-        self.set_fill_color(200, 220, 255)
+        # La ruta puede traer caracteres fuera de latin-1 (o nombres no UTF-8)
+        if not title.isascii():
+            title = title.encode('latin-1', 'replace').decode('latin-1')
         self.cell(0, 10, title, 0, 1, 'L', 1)
         self.ln(4)
 
     def chapter_body(self, body):
-        self.set_font('Courier', '', 8)
         # Limpiar caracteres problemáticos para latin-1
-        body = body.encode('latin-1', 'replace').decode('latin-1')
-        self.multi_cell(0, 5, body)
+        self.chapter_body_latin1(body.encode('latin-1', 'replace').decode('latin-1'))
+
+    def chapter_body_latin1(self, body):
+        """Como chapter_body, con el texto ya limpio para latin-1.
+        Las líneas se cortan aquí a ANCHO_LINEA_CODIGO y se escriben con cell(),
+        sin pasar por el ajuste carácter a carácter de multi_cell."""
+        self.set_font('Courier', '', 8)
+        ancho = ANCHO_LINEA_CODIGO
+        for linea in body.splitlines():
+            if len(linea) <= ancho:
+                self.cell(0, 5, linea, 0, 1)
+            else:
+                for i in range(0, len(linea), ancho):
+                    self.cell(0, 5, linea[i:i + ancho], 0, 1)
         self.ln()
 
 
@@ -68,34 +98,92 @@ class PDFReporte(FPDF):
         self.cell(0, 8, titulo, 0, 1, 'L', 1)
         self.ln(2)
     
+    @staticmethod
+    def _limpiar(texto):
+        """Reemplaza lo que no cabe en latin-1; el texto ASCII se devuelve tal cual"""
+        if texto.isascii():
+            return texto
+        return texto.encode('latin-1', 'replace').decode('latin-1')
+    
     def contenido(self, texto):
         self.set_font('Courier', '', 7)
-        texto = texto.encode('latin-1', 'replace').decode('latin-1')
-        self.multi_cell(0, 4, texto)
+        self.multi_cell(0, 4, self._limpiar(texto))
     
     def linea(self, texto, negrita=False):
         if negrita:
             self.set_font('Arial', 'B', 9)
         else:
             self.set_font('Courier', '', 7)
-        texto = texto.encode('latin-1', 'replace').decode('latin-1')
-        self.cell(0, 4, texto[:120], 0, 1)  # Limitar largo
+        # Recortar antes de limpiar: el reemplazo es carácter a carácter
+        self.cell(0, 4, self._limpiar(texto[:120]), 0, 1)  # Limitar largo
 
 
-def es_archivo_texto(ruta_archivo):
-    """Intenta leer el archivo para ver si es texto o binario"""
+def _leer_archivo(ruta_archivo, validar_utf8=False):
+    """
+    Lee un archivo para el PDF. Retorna (contenido, error), con el contenido
+    ya limpio para latin-1 (así la conversión corre en el hilo lector).
+    Con validar_utf8, si los primeros BYTES_SONDEO_TEXTO no son UTF-8 válido
+    el archivo se considera binario y se retorna (None, None) sin leer el resto.
+    """
     try:
-        with open(ruta_archivo, 'r', encoding='utf-8') as f:
-            f.read(1024)
-        return True
-    except (UnicodeDecodeError, PermissionError, IOError):
-        return False
+        if validar_utf8:
+            # Sondeo y lectura en una sola apertura: el inicio se decodifica
+            # estricto y el resto con reemplazo (el decodificador incremental
+            # conserva un carácter partido en el límite del sondeo)
+            decodificador = codecs.getincrementaldecoder('utf-8')()
+            with open(ruta_archivo, 'rb') as codigo:
+                inicio = decodificador.decode(codigo.read(BYTES_SONDEO_TEXTO))
+                decodificador.errors = 'replace'
+                contenido = inicio + decodificador.decode(codigo.read(), final=True)
+        else:
+            # Lista blanca de código: se confía en la extensión
+            with open(ruta_archivo, 'r', encoding='utf-8', errors='replace') as codigo:
+                contenido = codigo.read()
+    except UnicodeDecodeError:
+        return None, None
+    except Exception as e:
+        return None, e
+    return contenido.encode('latin-1', 'replace').decode('latin-1'), None
+
+
+def _recorrer_arbol(ruta_raiz, excluir=None):
+    """
+    Recorre ruta_raiz en profundidad con os.scandir, en el mismo orden que
+    os.walk y sin seguir enlaces a carpetas. Genera (nombre_carpeta, nivel,
+    archivos) por carpeta, con los archivos como DirEntry: cada uno trae
+    nombre, ruta y tipo (d_type de getdents) sin un stat adicional.
+    Las carpetas de CARPETAS_IGNORADAS y la ruta excluir se omiten.
+    """
+    pila = [(ruta_raiz, os.path.basename(ruta_raiz) or ruta_raiz, 0)]
+    while pila:
+        root, nombre_carpeta, level = pila.pop()
+        try:
+            with os.scandir(root) as it:
+                entradas = list(it)
+        except OSError:
+            continue
+        
+        dirs = []
+        files = []
+        for entry in entradas:
+            if entry.is_dir():
+                if entry.name in CARPETAS_IGNORADAS:
+                    continue
+                if not entry.is_symlink():
+                    dirs.append(entry)
+            elif entry.path != excluir:
+                files.append(entry)
+        
+        # Apilar al revés para visitar en el mismo orden que os.walk
+        pila.extend((d.path, d.name, level + 1) for d in reversed(dirs))
+        yield nombre_carpeta, level, files
 
 
 def generar_arbol_y_extraer(ruta_raiz, nombre_pdf="Codigo_Fuente_Completo.pdf", 
                             nombre_mapa="mapa_proyecto.txt", callback=None,
                             generar_mapa=True, generar_pdf=True,
-                            extensiones_codigo=None, carpeta_salida=None):
+                            extensiones_codigo=None, carpeta_salida=None,
+                            verbose=False):
     """
     Genera el árbol de directorios, estadísticas y PDF.
     
@@ -108,6 +196,7 @@ def generar_arbol_y_extraer(ruta_raiz, nombre_pdf="Codigo_Fuente_Completo.pdf",
         generar_pdf: Si True, genera el PDF con código fuente
         extensiones_codigo: Set de extensiones a incluir en PDF (None = todas las de texto)
         carpeta_salida: Carpeta donde guardar los archivos (None = misma que ruta_raiz)
+        verbose: Si True, también imprime los mensajes por consola (uso CLI)
     
     Returns:
         dict con estadísticas del proceso
@@ -122,105 +211,177 @@ def generar_arbol_y_extraer(ruta_raiz, nombre_pdf="Codigo_Fuente_Completo.pdf",
     else:
         carpeta_salida = ruta_raiz
 
+    # Normalizar la lista blanca una sola vez (ext ya se extrae en minúsculas)
+    if extensiones_codigo is not None:
+        extensiones_codigo = frozenset(e.lower() for e in extensiones_codigo)
+
     pdf = None
     if generar_pdf:
         pdf = PDFGenerator()
         pdf.add_page()
     
     estructura_arbol = []
-    conteo_formatos = {}
+    conteo_formatos = Counter()
     archivos_procesados = 0
     total_archivos = 0
     
     def log(mensaje):
         if callback:
             callback(mensaje)
-        print(mensaje)
+        if verbose:
+            print(mensaje)
     
     log(f"Iniciando escaneo en: {ruta_raiz}...")
 
-    # Primer paso: contar archivos totales
-    for root, dirs, files in os.walk(ruta_raiz):
-        dirs[:] = [d for d in dirs if d not in CARPETAS_IGNORADAS]
-        total_archivos += len(files)
+    # Crear carpeta de salida si no existe (el mapa .txt se abre antes del recorrido)
+    if not os.path.exists(carpeta_salida):
+        try:
+            os.makedirs(carpeta_salida, exist_ok=True)
+        except OSError as e:
+            log(f"Error creando carpeta de salida: {e}")
+            return None
     
-    archivos_analizados = 0
+    ruta_pdf = os.path.join(carpeta_salida, nombre_pdf) if generar_pdf else None
+    ruta_mapa = os.path.join(carpeta_salida, nombre_mapa) if generar_mapa else None
     
-    for root, dirs, files in os.walk(ruta_raiz):
-        # Filtrar carpetas ignoradas
-        dirs[:] = [d for d in dirs if d not in CARPETAS_IGNORADAS]
-        
-        # Nivel de indentación para el mapa visual
-        # Usar os.path.relpath es más seguro que replace para rutas
+    # Mapa en texto plano: cada línea se escribe al archivo según se
+    # descubre, sin acumular el árbol entero en memoria. El mapa PDF sí
+    # necesita la lista completa para renderizarse al final
+    mapa_txt = generar_mapa and nombre_mapa.lower().endswith('.txt')
+    f_mapa = None
+    
+    def cerrar_mapa():
+        nonlocal f_mapa
         try:
-            ruta_relativa_dir = os.path.relpath(root, ruta_raiz)
-            if ruta_relativa_dir == '.':
-                level = 0
-            else:
-                level = ruta_relativa_dir.count(os.sep) + 1
-        except ValueError:
-             level = 0 # Fallback si hay error con path
-        
-        indent = '    ' * level
-        nombre_carpeta = os.path.basename(root)
-        if nombre_carpeta == '':
-            nombre_carpeta = os.path.basename(ruta_raiz) or ruta_raiz
+            f_mapa.close()
+        except Exception:
+            pass
+        f_mapa = None
+    
+    if mapa_txt:
+        try:
+            # errors='replace': en Linux un nombre de archivo puede no ser
+            # UTF-8 válido y no debe interrumpir el mapa
+            f_mapa = open(ruta_mapa, 'w', encoding='utf-8', errors='replace')
+            f_mapa.write("ARBOL DE DIRECTORIOS\n\n")
+        except Exception as e:
+            log(f"Error guardando mapa: {e}")
+            if f_mapa is not None:
+                cerrar_mapa()
         
-        estructura_arbol.append(f"{indent}[DIR] {nombre_carpeta}/")
-        subindent = '    ' * (level + 1)
+        def agregar_linea(linea):
+            # Un fallo de escritura (disco lleno, unidad de red caída) deja
+            # de escribir el mapa, pero el recorrido y el PDF continúan
+            if f_mapa is None:
+                return
+            try:
+                f_mapa.write(linea)
+                f_mapa.write('\n')
+            except Exception as e:
+                log(f"Error guardando mapa: {e}")
+                cerrar_mapa()
+    else:
+        agregar_linea = estructura_arbol.append
+
+    archivos_analizados = 0
+    # Decisiones del PDF que no cambian durante el recorrido
+    pdf_activo = generar_pdf and pdf is not None
+    modo_codigo = pdf_activo and extensiones_codigo is not None
+    archivos_pdf = []  # (ruta relativa, ruta completa, nombre) en orden de recorrido
+    
+    # Todo lo recorrido cuelga de ruta_raiz: la ruta relativa es un simple
+    # recorte del prefijo (ruta_raiz solo termina en separador si es la raíz
+    # del disco)
+    base_len = len(ruta_raiz) if ruta_raiz.endswith(os.sep) else len(ruta_raiz) + len(os.sep)
+    try:
+        for nombre_carpeta, level, files in _recorrer_arbol(ruta_raiz, excluir=ruta_mapa):
+            indent = '    ' * level
+            agregar_linea(f"{indent}[DIR] {nombre_carpeta}/")
+            subindent = '    ' * (level + 1)
         
-        for f in files:
-            archivos_analizados += 1
-            ruta_completa = os.path.join(root, f)
-            ext = os.path.splitext(f)[1].lower()
+            total_archivos += len(files)
+            for entry in files:
+                archivos_analizados += 1
+                f = entry.name
+                dot = f.rfind('.')
+                ext = f[dot:].lower() if dot > 0 else ''
             
-            # 1. Actualizar Mapa
-            estructura_arbol.append(f"{subindent}|-- {f}")
+                # 1. Actualizar Mapa
+                agregar_linea(f"{subindent}|-- {f}")
             
-            # 2. Actualizar Estadísticas
-            conteo_formatos[ext] = conteo_formatos.get(ext, 0) + 1
+                # 2. Actualizar Estadísticas
+                conteo_formatos[ext] += 1
             
-            # 3. Procesar PDF (Solo si está habilitado, es código y es texto)
-            if generar_pdf and pdf is not None:
-                # Verificar si debe incluirse en el PDF
-                incluir_en_pdf = False
-                if extensiones_codigo is not None:
-                    # Solo extensiones específicas de código
-                    incluir_en_pdf = ext.lower() in extensiones_codigo or f.lower() in extensiones_codigo
-                else:
-                    # Incluir todo lo que sea texto y no esté ignorado
-                    incluir_en_pdf = ext not in EXTENSIONES_IGNORADAS
-                
-                if incluir_en_pdf and es_archivo_texto(ruta_completa):
+                # 3. Procesar PDF (Solo si está habilitado, es código y es texto)
+                if not pdf_activo:
+                    continue
+                if modo_codigo:
+                    # Solo extensiones específicas de código: el resto se descarta
+                    # antes de cualquier otro trabajo
+                    if ext not in extensiones_codigo and f.lower() not in extensiones_codigo:
+                        continue
+                    # Un binario con extensión de código no se llega a leer
                     try:
-                        with open(ruta_completa, 'r', encoding='utf-8', errors='replace') as codigo:
-                            contenido = codigo.read()
-                            
-                            # Agregar al PDF
-                            ruta_relativa_archivo = os.path.relpath(ruta_completa, ruta_raiz)
-                            pdf.chapter_title(f"Archivo: {ruta_relativa_archivo}")
-                            pdf.chapter_body(contenido)
-                            archivos_procesados += 1
-                            
-                            if archivos_analizados % 10 == 0:
-                                log(f"Procesando... {archivos_analizados}/{total_archivos} archivos")
-                                
-                    except Exception as e:
-                        log(f"Error leyendo {f}: {e}")
-
-    # Crear carpeta de salida si no existe
-    if not os.path.exists(carpeta_salida):
-        try:
-            os.makedirs(carpeta_salida)
-        except OSError as e:
-            log(f"Error creando carpeta de salida: {e}")
-            return None
+                        if entry.stat().st_size > MAX_BYTES_CODIGO:
+                            continue
+                    except OSError:
+                        continue
+                elif ext in EXTENSIONES_IGNORADAS:
+                    # Incluir todo lo que sea texto y no esté ignorado
+                    continue
+            
+                ruta_completa = entry.path
+                archivos_pdf.append((ruta_completa[base_len:], ruta_completa, f))
+        
+        # Cerrar el mapa de texto con el resumen de distribución
+        if f_mapa is not None:
+            try:
+                f_mapa.write("\nDISTRIBUCION DE ARCHIVOS\n\n")
+                for ext, count in sorted(conteo_formatos.items()):
+                    f_mapa.write(f"{ext if ext else 'Sin ext'}: {count} archivos\n")
+                f_mapa.close()
+                f_mapa = None
+                log(f"Mapa guardado en: {ruta_mapa}")
+            except Exception as e:
+                log(f"Error guardando mapa: {e}")
+    finally:
+        if f_mapa is not None:
+            cerrar_mapa()
     
-    ruta_pdf = os.path.join(carpeta_salida, nombre_pdf) if generar_pdf else None
-    ruta_mapa = os.path.join(carpeta_salida, nombre_mapa.replace('.txt', '.pdf')) if generar_mapa else None
+    # 4. Leer los archivos del PDF en paralelo (I/O) y agregarlos en orden;
+    # fpdf no es thread-safe, así que el PDF solo se modifica en este hilo.
+    # Solo hay VENTANA_LECTURA lecturas adelantadas: cada contenido se libera
+    # al pasar al PDF en vez de acumular el proyecto entero en memoria
+    if archivos_pdf:
+        validar_utf8 = extensiones_codigo is None
+        with ThreadPoolExecutor(max_workers=HILOS_LECTURA) as ex:
+            siguientes = iter(archivos_pdf)
+            en_vuelo = deque(
+                (a, ex.submit(_leer_archivo, a[1], validar_utf8))
+                for a in itertools.islice(siguientes, VENTANA_LECTURA)
+            )
+            while en_vuelo:
+                (ruta_relativa_archivo, _, f), futuro = en_vuelo.popleft()
+                siguiente = next(siguientes, None)
+                if siguiente is not None:
+                    en_vuelo.append((siguiente, ex.submit(_leer_archivo, siguiente[1], validar_utf8)))
+                
+                contenido, error = futuro.result()
+                if error is not None:
+                    log(f"Error leyendo {f}: {error}")
+                    continue
+                if contenido is None:
+                    continue
+                
+                pdf.chapter_title(f"Archivo: {ruta_relativa_archivo}")
+                pdf.chapter_body_latin1(contenido)
+                archivos_procesados += 1
+                
+                if archivos_procesados % INTERVALO_PROGRESO == 0:
+                    log(f"Procesando... {archivos_procesados}/{len(archivos_pdf)} archivos")
 
     # GUARDAR MAPA PDF
-    if generar_mapa and ruta_mapa:
+    if generar_mapa and not mapa_txt:
         try:
             pdf_mapa = PDFReporte("Estructura de Directorios")
             pdf_mapa.add_page()
@@ -262,7 +423,7 @@ def generar_arbol_y_extraer(ruta_raiz, nombre_pdf="Codigo_Fuente_Completo.pdf",
     resultado = {
         'archivos_procesados': archivos_procesados,
         'total_archivos': total_archivos,
-        'conteo_formatos': conteo_formatos,
+        'conteo_formatos': dict(conteo_formatos),
         'ruta_pdf': ruta_pdf,
         'ruta_mapa': ruta_mapa
     }
@@ -283,4 +444,4 @@ if __name__ == "__main__":
     else:
         directorio = "."
     
-    generar_arbol_y_extraer(directorio)
+    generar_arbol_y_extraer(directorio, verbose=True)